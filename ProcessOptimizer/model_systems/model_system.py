@@ -1,7 +1,12 @@
-from typing import Callable, List, Union
+import functools
+import itertools
+import weakref
+from typing import Callable, List, Optional, Union
 
 import numpy as np
+from joblib import Parallel, delayed
 from ProcessOptimizer import expected_minimum, Space, space_factory
+from ProcessOptimizer.space import Categorical, Integer
 from ProcessOptimizer.model_systems.noise_models import NoiseModel, parse_noise_model
 
 class ModelSystem:
@@ -20,6 +25,16 @@ class ModelSystem:
 
     * `true_min` [float]:
         The true minimum value of the score function within the parameter space.
+        If None, it is estimated by sampling the space and evaluating the
+        score at every sample.
+
+    * `true_max` [float]:
+        The true maximum value of the score function within the parameter space.
+        If None, it is estimated the same way as `true_min`, from the same
+        samples if those were drawn, and otherwise lazily on first access.
+
+        For analytic benchmark systems where the extrema are known, pass both
+        `true_min` and `true_max` to skip the bootstrap sampling entirely.
 
     * `noise_model` [str, dict, or NoiseModel]:
         Noise model to apply to the score.
@@ -32,32 +47,187 @@ class ModelSystem:
             "constant": The noise level is constant.
             "proportional": Tne noise level is proportional to the score.
             "zero": No noise is applied.
+
+    * `n_jobs` [int, default=1]:
+        Number of cores to use when evaluating `score` during the bootstrap
+        estimation of `true_min`/`true_max`. Keep the default of 1 for cheap
+        score functions, where the overhead of distributing the work would
+        dominate. If `n_jobs=-1`, all available cores are used.
     """
     def __init__(
-        self, 
-        score: Callable[..., float], 
-        space: Union[Space, List], 
-        noise_model: Union[str, dict, NoiseModel], 
+        self,
+        score: Callable[..., float],
+        space: Union[Space, List],
+        noise_model: Union[str, dict, NoiseModel],
         true_min=None,
         true_max=None,
+        n_jobs: int = 1,
     ):
         self.score = score
+        # Memoize the score on the point, so that repeated evaluations of the
+        # same point (common in benchmarks, especially near the minimum) do
+        # not pay for the score calculation again.
+        self._score_cached = functools.lru_cache(maxsize=4096)(
+            lambda point: score(list(point))
+        )
+        # Whether the score function accepts a batch of points in one call.
+        # Determined lazily on the first batch evaluation.
+        self._score_is_vectorized = None
         self.space = space_factory(space)
         self.noise_model = parse_noise_model(noise_model)
+        # Cache of expected minimum locations per optimization result, so
+        # repeated result_loss calls on the same result do not re-run the
+        # surrogate minimization.
+        self._expected_min_cache = {}
+        self._n_jobs = n_jobs
+        self._bootstrap_points = None
+        self._bootstrap_scores = None
         if true_min is None:
-            ndims = self.space.n_dims
-            points = self.space.lhs(ndims*10) #TODO: This should be many more and shouldnt use LHS
-            scores = [score(point) for point in points]
-            true_min = np.min(scores)
+            scores = self._run_bootstrap()
+            true_min = scores.min()
+            # The maximum comes for free from the same sample
+            if true_max is None:
+                true_max = scores.max()
         self.true_min = true_min
-        if true_max is None:
+        if true_max is not None:
+            self.true_max = true_max
+        # If true_max is still unknown, it is estimated lazily by the
+        # true_max cached property on first access, so systems that never
+        # read it do not pay for the bootstrap.
+
+    @functools.cached_property
+    def true_max(self):
+        """The true maximum value of the score function within the parameter
+        space, estimated from a bootstrap sample on first access."""
+        return self._run_bootstrap().max()
+
+    @functools.cached_property
+    def true_range(self):
+        """The range of the score function within the parameter space, i.e.
+        `true_max - true_min`. Useful for normalizing losses. Computed on
+        first access, since `true_max` can be lazy."""
+        return self.true_max - self.true_min
+
+    def _run_bootstrap(self) -> np.ndarray:
+        """
+        Sample the space and evaluate the score at every sample, for
+        estimating the extrema of the score function. The samples and scores
+        are cached, so the cost is only paid once per system.
+        """
+        if self._bootstrap_scores is None:
             ndims = self.space.n_dims
-            points = self.space.lhs(ndims*10) #TODO: This should be many more and shouldnt use LHS
-            scores = [score(point) for point in points]
-            true_max = np.max(scores)
-        self.true_max = true_max
-        
-        
+            # The number of points we are willing to evaluate
+            budget = 2**max(10, int(np.ceil(np.log2(ndims*1000))))
+            grid = self._enumerate_discrete_space(max_points=budget)
+            if grid is not None:
+                # The space is fully discrete and small enough to evaluate
+                # exhaustively, giving exact extrema instead of estimates
+                points = grid
+            elif self.space.is_partly_categorical:
+                # Sobol sequences are not meaningful for categorical
+                # dimensions, so fall back to latin hypercube sampling.
+                # Discrete dimensions make duplicate samples likely, and
+                # duplicates add nothing to the extrema, so they are dropped
+                # before evaluation.
+                points = self.space.lhs(ndims*10)
+                seen = set()
+                unique_points = []
+                for point in points:
+                    key = tuple(point)
+                    if key not in seen:
+                        seen.add(key)
+                        unique_points.append(point)
+                points = unique_points
+            else:
+                # Quasi-random Sobol samples cover the space more evenly than
+                # LHS and are cheap enough that we can afford many more
+                # points, giving tighter estimates of the extrema. The budget
+                # is a power of 2, which keeps the sequence balanced.
+                points = self.space.sobol(budget)
+            self._bootstrap_points = points
+            self._bootstrap_scores = self._evaluate_scores(
+                points, n_jobs=self._n_jobs
+            )
+        return self._bootstrap_scores
+
+    def _enumerate_discrete_space(self, max_points: int) -> Optional[List]:
+        """
+        Return every point in the space if all dimensions are discrete and
+        the full grid holds at most `max_points` points, and None otherwise.
+        """
+        dimension_values = []
+        grid_size = 1
+        for dim in self.space.dimensions:
+            if isinstance(dim, Categorical):
+                values = dim.categories
+            elif isinstance(dim, Integer):
+                values = range(dim.low, dim.high + 1)
+            else:
+                return None
+            grid_size *= len(values)
+            if grid_size > max_points:
+                return None
+            dimension_values.append(values)
+        return [list(point) for point in itertools.product(*dimension_values)]
+
+    def _evaluate_score(self, X) -> float:
+        """
+        Evaluate the noiseless score at X, memoizing repeated points.
+
+        Points with unhashable entries cannot be used as cache keys and are
+        evaluated directly.
+        """
+        try:
+            return self._score_cached(tuple(X))
+        except TypeError:
+            return self.score(X)
+
+    def _evaluate_scores(self, Xs, n_jobs: int = 1) -> np.ndarray:
+        """
+        Evaluate the noiseless score for a batch of points.
+
+        If the score function accepts a batch of points, all points are
+        evaluated in a single call. Otherwise the points are evaluated one at
+        a time, distributed over `n_jobs` cores if `n_jobs` is not 1.
+        """
+        if self._score_is_vectorized is not False:
+            try:
+                # If the score function is vectorized, evaluating all points
+                # in one batch avoids the Python call overhead of a
+                # point-by-point loop.
+                scores = np.asarray(self.score(np.asarray(Xs)))
+                if scores.shape != (len(Xs),):
+                    raise ValueError("score is not vectorized over points")
+                # A scalar score that broadcasts over NumPy arrays can give a
+                # result of the right shape without being vectorized over
+                # points, e.g. when the batch size equals the number of
+                # dimensions. Cross-check one element against a scalar
+                # evaluation before trusting the batch; the memoization makes
+                # this cheap.
+                if len(Xs) > 0 and not np.isclose(
+                    scores[0], self._evaluate_score(Xs[0])
+                ):
+                    raise ValueError("score is not vectorized over points")
+                self._score_is_vectorized = True
+                return scores
+            except (TypeError, ValueError):
+                self._score_is_vectorized = False
+        if n_jobs == 1:
+            # With the count given, fromiter writes straight into a
+            # preallocated buffer, avoiding an intermediate list.
+            return np.fromiter(
+                (self._evaluate_score(point) for point in Xs),
+                dtype=np.float64,
+                count=len(Xs),
+            )
+        # The evaluations are independent, so for expensive score functions
+        # they can be distributed over several cores.
+        return np.asarray(
+            Parallel(n_jobs=n_jobs, prefer="processes")(
+                delayed(self.score)(point) for point in Xs
+            )
+        )
+
     def result_loss(self, result):
         """
         Calculate the loss of the optimization result. 
@@ -74,10 +244,25 @@ class ModelSystem:
             value at the location of the model's expected minimum and the best 
             possible system value. 
         """
-        # Get the location of the expected minimum
-        model_x, _ = expected_minimum(result)
+        # Get the location of the expected minimum. Minimizing the surrogate
+        # model is expensive, so the location is cached per result.
+        key = id(result)
+        cached = self._expected_min_cache.get(key)
+        if cached is not None and cached[0]() is result:
+            model_x = cached[1]
+        else:
+            # Warm-starting from the best observed points lets us get away
+            # with far fewer random restarts than the default.
+            model_x, _ = expected_minimum(
+                result, n_best_starts=5, n_random_starts=5
+            )
+            # The weak reference guards against a recycled id from a garbage
+            # collected result being mistaken for the cached one, and the
+            # finalizer evicts the entry when the result is collected.
+            self._expected_min_cache[key] = (weakref.ref(result), model_x)
+            weakref.finalize(result, self._expected_min_cache.pop, key, None)
         # Calculate the difference between the score at model_x and the true minimum value
-        loss = self.score(model_x) - self.true_min
+        loss = self._evaluate_score(model_x) - self.true_min
         return loss
     
     def get_score(self, X) -> float:
@@ -92,9 +277,29 @@ class ModelSystem:
         -------
         * Noisy score at X [float].
         """
-        Y = self.score(X)
+        Y = self._evaluate_score(X)
         return Y + self.noise_model.get_noise(X, Y)
-    
+
+    def get_scores(self, Xs) -> np.ndarray:
+        """
+        Returns the noisy scores of the system for a batch of points.
+
+        Evaluating a batch in one call avoids the Python call overhead of
+        point-by-point evaluation, and lets the noise model draw all noise
+        values in one vectorized call.
+
+        Parameters
+        ----------
+        * `Xs` [list of lists, shape=(n_points, n_dims)]:
+            The points in space to evaluate the score at.
+
+        Returns
+        -------
+        * Noisy scores at Xs [np.ndarray].
+        """
+        Ys = self._evaluate_scores(Xs)
+        return Ys + self.noise_model.get_noise_batch(Xs, Ys)
+
     def set_noise_model(self, noise_model: Union[str, dict, NoiseModel]):
         """
         Sets or updates the noise model used by the model system.
@@ -40,26 +40,63 @@ class NoiseModel(ABC):
     @abstractmethod
     def get_noise(self, X, Y: float) -> float:
         pass
-    
+
+    def get_noise_batch(self, X, Y) -> np.ndarray:
+        """Noise values for a batch of points.
+
+        Parameters
+        ----------
+        * `X`: The points in space the scores were evaluated at.
+
+        * `Y`: The scores at the points.
+
+        Returns
+        -------
+        * Noise values for all points [np.ndarray].
+
+        The default implementation evaluates the points one at a time.
+        Subclasses override this with a single vectorized draw from the
+        random number generator where possible.
+        """
+        return np.asarray([self.get_noise(x, y) for x, y in zip(X, Y)])
+
     @property
     def _sample_noise(self) -> float:
         """A raw noise value, to be used in the get_noise() function."""
         if self.noise_size is None:
             raise TypeError("Method \"raw_noise()\" for NoiseModel class "
                             f"{self.__class__.__name__} is not supposed to be called.")
-            
+
         return self._noise_distribution()*self.noise_size
-    
+
+    def _sample_noise_batch(self, n: int) -> np.ndarray:
+        """n raw noise values drawn in one vectorized call, to be used in the
+        get_noise_batch() function."""
+        if self.noise_size is None:
+            raise TypeError("Method \"_sample_noise_batch()\" for NoiseModel class "
+                            f"{self.__class__.__name__} is not supposed to be called.")
+
+        try:
+            return self._noise_distribution(size=n)*self.noise_size
+        except TypeError:
+            # Noise distributions that do not take a size argument, e.g.
+            # constant distributions, are drawn once and broadcast over the
+            # batch, so the noise application stays a single affine array
+            # operation.
+            return np.full(n, self._noise_distribution()*self.noise_size)
+
     def set_noise_type(self, noise_type: str):
         if noise_type in ["normal", "Gaussian", "norm"]:
             self.noise_type = noise_type
             self._noise_distribution = self._rng.normal
         elif noise_type == "uniform":
             self.noise_type = noise_type
-            self._noise_distribution = lambda: self._rng.uniform(low=-1, high=1)
+            self._noise_distribution = (
+                lambda size=None: self._rng.uniform(low=-1, high=1, size=size)
+            )
         else:
             raise ValueError(f"Noise distribution \"{noise_type}\" not recognised.")
-    
+
     def set_seed(self, seed: Optional[int]):
         # Instantiate the random number generator again
         self._rng = np.random.default_rng(seed)
@@ -67,7 +104,9 @@ class NoiseModel(ABC):
         if self.noise_type in ["normal", "Gaussian", "norm"]:
             self._noise_distribution = self._rng.normal
         elif self.noise_type == "uniform":
-            self._noise_distribution = lambda: self._rng.uniform(low=-1, high=1)
+            self._noise_distribution = (
+                lambda size=None: self._rng.uniform(low=-1, high=1, size=size)
+            )
 
 class ConstantNoise(NoiseModel):
     """
@@ -86,7 +125,10 @@ class ConstantNoise(NoiseModel):
     def get_noise(self, _, Y: float) -> float:
         return self._sample_noise
 
-    
+    def get_noise_batch(self, _, Y) -> np.ndarray:
+        return self._sample_noise_batch(len(Y))
+
+
 class ProportionalNoise(NoiseModel):
     """
     Noise model for noise proportional to the signal, but independent of the sampled
@@ -103,7 +145,10 @@ class ProportionalNoise(NoiseModel):
     
     def get_noise(self, _, Y: float) -> float:
         return self._sample_noise*Y
-    
+
+    def get_noise_batch(self, _, Y) -> np.ndarray:
+        return self._sample_noise_batch(len(Y))*np.asarray(Y)
+
 
 class DataDependentNoise(NoiseModel):
     """
@@ -147,6 +192,9 @@ class ZeroNoise(NoiseModel):
     def get_noise(self, _, Y: float) -> float:
         return 0
 
+    def get_noise_batch(self, _, Y) -> np.ndarray:
+        return np.zeros(len(Y))
+
 class SumNoise(NoiseModel):
     """
     Noise model that returns the sum of two or more noise models. Can be used if the
@@ -173,6 +221,12 @@ class SumNoise(NoiseModel):
         noise_list = [model.get_noise(X, Y) for model in self.noise_model_list]
         return sum(noise_list)
 
+    def get_noise_batch(self, X, Y) -> np.ndarray:
+        noise_list = [
+            model.get_noise_batch(X, Y) for model in self.noise_model_list
+        ]
+        return np.sum(noise_list, axis=0)
+
 
 def parse_noise_model(model: Union[str, dict, NoiseModel], **kwargs) -> NoiseModel:
     if isinstance(model, NoiseModel):
@@ -182,12 +236,18 @@ def parse_noise_model(model: Union[str, dict, NoiseModel], **kwargs) -> NoiseMod
     else:
         return noise_model_factory(**model)
 
+# Model classes by type name, resolved once at import. A NoiseModel instance
+# itself is never reused between calls, since it carries its own random number
+# generator state.
+_noise_model_classes = {
+    "constant": ConstantNoise,
+    "proportional": ProportionalNoise,
+    "zero": ZeroNoise,
+}
+
 def noise_model_factory(model_type: str, **kwargs) -> NoiseModel:
-    if model_type == "constant":
-        return ConstantNoise(**kwargs)
-    elif model_type == "proportional":
-        return ProportionalNoise(**kwargs)
-    elif model_type == "zero":
-        return ZeroNoise()
-    else:
-        raise ValueError(f"Noise model of type '{model_type}' not recognised")
\ No newline at end of file
+    try:
+        model_class = _noise_model_classes[model_type]
+    except KeyError:
+        raise ValueError(f"Noise model of type '{model_type}' not recognised")
+    return model_class(**kwargs)
\ No newline at end of file
@@ -938,4 +938,47 @@ class Space(object):
             transposed_samples.append(row)
         return transposed_samples
 
+    def sobol(
+        self,
+        n: int,
+        seed: Union[int, np.random.Generator, None] = 42,
+    ):
+        """Returns n quasi-random Sobol samples as a list of lists.
+
+        Sobol sequences are low-discrepancy, so they cover the space more
+        evenly than random sampling, and they are much cheaper to generate
+        than latin hypercube samples for large n.
+
+        Parameters
+        ----------
+        * `n` [int]: The number of samples to generate. Sobol sequences are
+            balanced only when n is a power of 2, so other values of n give
+            samples of degraded quality.
+
+        * `seed` [int, np.random.Generator, or None, default=42]:
+            The seed used to scramble the Sobol sequence. If None, the
+            results are not reproducible.
+        """
+        from scipy.stats import qmc
+
+        engine = qmc.Sobol(d=self.n_dims, scramble=True, seed=seed)
+        if n > 0 and n & (n - 1) == 0:
+            # Powers of 2 are drawn through random_base2, which guarantees a
+            # balanced sequence.
+            unit_samples = engine.random_base2(m=int(np.log2(n)))
+        else:
+            unit_samples = engine.random(n)
+        samples = []
+        for i in range(self.n_dims):
+            samples.append(self.dimensions[i].sample(unit_samples[:, i]))
+        # Transpose to get a list of points, each with a sample for every
+        # dimension
+        transposed_samples = []
+        for i in range(n):
+            row = []
+            for j in range(self.n_dims):
+                row.append(samples[j][i])
+            transposed_samples.append(row)
+        return transposed_samples
+
     # TODO: Add a R1 QRS sampling method here
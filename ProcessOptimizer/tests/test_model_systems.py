@@ -0,0 +1,189 @@
+import numpy as np
+import pytest
+import ProcessOptimizer.model_systems.model_system as model_system_module
+from ProcessOptimizer.model_systems.model_system import ModelSystem
+from ProcessOptimizer.space import Categorical, Integer
+
+
+@pytest.fixture
+def quadratic_system():
+    return ModelSystem(
+        score=lambda x: x[0] ** 2,
+        space=[(-1.0, 1.0)],
+        noise_model="zero",
+    )
+
+
+def test_bootstrapped_extrema(quadratic_system):
+    # The extrema are estimated from the same set of LHS samples, so the
+    # minimum can never exceed the maximum.
+    assert quadratic_system.true_min <= quadratic_system.true_max
+    assert 0 <= quadratic_system.true_min <= 1
+    assert 0 <= quadratic_system.true_max <= 1
+
+
+def test_given_extrema_skip_bootstrap():
+    system = ModelSystem(
+        score=lambda x: x[0] ** 2,
+        space=[(-1.0, 1.0)],
+        noise_model="zero",
+        true_min=0,
+        true_max=1,
+    )
+    assert system.true_min == 0
+    assert system.true_max == 1
+    assert system.true_range == 1
+
+
+def test_discrete_space_exact_extrema():
+    # A small fully discrete space is enumerated exhaustively, so the
+    # extrema are exact rather than sampling estimates
+    system = ModelSystem(
+        score=lambda x: x[0] + (1 if x[1] == "b" else 0),
+        space=[Integer(0, 3), Categorical(["a", "b"])],
+        noise_model="zero",
+    )
+    assert system.true_min == 0
+    assert system.true_max == 4
+
+
+def test_true_max_is_lazy():
+    calls = []
+
+    def score(x):
+        calls.append(x)
+        return x[0] ** 2
+
+    system = ModelSystem(
+        score=score,
+        space=[(-1.0, 1.0)],
+        noise_model="zero",
+        true_min=0,
+    )
+    # With true_min given, constructing the system should not evaluate the
+    # score; the bootstrap for true_max only runs on first access
+    assert len(calls) == 0
+    assert 0 <= system.true_max <= 1
+    assert len(calls) > 0
+
+
+def test_score_memoization():
+    calls = []
+
+    def score(x):
+        calls.append(x)
+        return x[0] ** 2
+
+    system = ModelSystem(
+        score=score,
+        space=[(-1.0, 1.0)],
+        noise_model="zero",
+        true_min=0,
+        true_max=1,
+    )
+    system.get_score([0.5])
+    system.get_score([0.5])
+    system.get_score([0.7])
+    # The repeated point should only be evaluated once
+    assert len(calls) == 2
+
+
+def test_result_loss_caches_expected_minimum(quadratic_system, monkeypatch):
+    calls = []
+
+    def fake_expected_minimum(result, **kwargs):
+        calls.append(result)
+        return [0.5], 0.25
+
+    class FakeResult:
+        pass
+
+    monkeypatch.setattr(
+        model_system_module, "expected_minimum", fake_expected_minimum
+    )
+    result = FakeResult()
+    first_loss = quadratic_system.result_loss(result)
+    second_loss = quadratic_system.result_loss(result)
+    # The surrogate minimization should only run once per result
+    assert len(calls) == 1
+    assert first_loss == second_loss
+    # A different result is not served from the cache
+    quadratic_system.result_loss(FakeResult())
+    assert len(calls) == 2
+
+
+def test_parallel_bootstrap(quadratic_system):
+    parallel_system = ModelSystem(
+        score=lambda x: x[0] ** 2,
+        space=[(-1.0, 1.0)],
+        noise_model="zero",
+        n_jobs=2,
+    )
+    # The bootstrap should give the same extrema regardless of how the score
+    # evaluations are distributed.
+    assert parallel_system.true_min == quadratic_system.true_min
+    assert parallel_system.true_max == quadratic_system.true_max
+
+
+def test_get_scores_batch(quadratic_system):
+    Xs = [[-0.5], [0.0], [0.5]]
+    scores = quadratic_system.get_scores(Xs)
+    assert scores.shape == (3,)
+    # With zero noise, the batched scores equal the noiseless scores
+    assert np.allclose(scores, [0.25, 0.0, 0.25])
+
+
+def test_get_scores_broadcastable_scalar_score():
+    # A scalar score that broadcasts over NumPy arrays must not be mistaken
+    # for a vectorized one, even when the batch size equals the number of
+    # dimensions, where broadcasting over rows happens to give a result of
+    # the right shape.
+    system = ModelSystem(
+        score=lambda x: x[0] ** 2 + x[1] ** 2,
+        space=[(-5.0, 5.0), (-5.0, 5.0)],
+        noise_model="zero",
+        true_min=0,
+        true_max=50,
+    )
+    scores = system.get_scores([[1.0, 2.0], [3.0, 4.0]])
+    assert np.allclose(scores, [5.0, 25.0])
+
+
+def test_get_scores_matches_get_score():
+    Xs = [[-0.5], [0.0], [0.5]]
+    batch_system = ModelSystem(
+        score=lambda x: x[0] ** 2,
+        space=[(-1.0, 1.0)],
+        noise_model="constant",
+        true_min=0,
+        true_max=1,
+    )
+    scalar_system = ModelSystem(
+        score=lambda x: x[0] ** 2,
+        space=[(-1.0, 1.0)],
+        noise_model="constant",
+        true_min=0,
+        true_max=1,
+    )
+    batch_scores = batch_system.get_scores(Xs)
+    scalar_scores = [scalar_system.get_score(X) for X in Xs]
+    # Both systems draw from identically seeded generators, so the batched
+    # path gives the same noisy scores as point-by-point evaluation
+    assert np.allclose(batch_scores, scalar_scores)
+
+
+def test_vectorized_score_bootstrap():
+    # A score function that accepts a batch of points should be evaluated in
+    # a single call, and give the same extrema as point-by-point evaluation.
+    vectorized_system = ModelSystem(
+        score=lambda x: np.sum(np.asarray(x) ** 2, axis=-1),
+        space=[(-1.0, 1.0), (-1.0, 1.0)],
+        noise_model="zero",
+    )
+    scalar_system = ModelSystem(
+        score=lambda x: x[0] ** 2 + x[1] ** 2,
+        space=[(-1.0, 1.0), (-1.0, 1.0)],
+        noise_model="zero",
+    )
+    assert vectorized_system.true_min == scalar_system.true_min
+    assert vectorized_system.true_max == scalar_system.true_max
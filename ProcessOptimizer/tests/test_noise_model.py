@@ -22,14 +22,16 @@ def signal_list():
 # If we are to fit the distributions, more data is needed
 @pytest.fixture
 def long_signal_list():
-    return [1]*1000 + [10]*1000
+    return np.concatenate([np.full(1000, 1.0), np.full(1000, 10.0)])
 
-# Setting the seed for the random number generator used so the tests are reproducible.
-def setup_function():
-    np.random.seed(42)
+# The noise models carry their own seeded np.random.Generator (default seed 42), so
+# the tests are reproducible without touching the legacy global RNG state. Not
+# seeding the global RNG also keeps the tests independent, so they can run in
+# parallel.
 
 # Function for fitting a distribution and evaulating its mean and standard deviation.
 def evaluate_random_dist(noise_list: List[float], size: float=1):
+    noise_list = np.asarray(noise_list)
     (mean, stddev) = norm.fit(noise_list)
     assert np.allclose(mean, 0, atol=0.1*size)
     assert np.allclose(stddev, size, atol=0.1*size)
@@ -49,42 +51,69 @@ def test_constant_noise(signal_list):
 def test_proportional_noise(signal_list, noise_level):
     noise_model = ProportionalNoise(noise_size=1)
     noise_model._noise_distribution = lambda: noise_level
-    noise_list = [noise_model.get_noise(None, signal) for signal in signal_list]
-    rel_noise_list = [noise/signal for (signal, noise) in zip(signal_list, noise_list)]
-    assert np.allclose(rel_noise_list, noise_level)
+    signals = np.asarray(signal_list)
+    noise = np.asarray([noise_model.get_noise(None, signal) for signal in signals])
+    assert np.allclose(noise/signals, noise_level)
+
+def test_batch_draws_match_scalar_draws(signal_list):
+    # A batched draw consumes the generator stream exactly like repeated
+    # scalar draws, so batching noise generation does not change the noise a
+    # seeded model produces.
+    signals = np.asarray(signal_list)
+    for noise_type in ("normal", "uniform"):
+        scalar_model = ConstantNoise(seed=7)
+        scalar_model.set_noise_type(noise_type)
+        batch_model = ConstantNoise(seed=7)
+        batch_model.set_noise_type(noise_type)
+        scalar_noise = [scalar_model.get_noise(None, Y) for Y in signals]
+        assert np.allclose(
+            batch_model.get_noise_batch(None, signals), scalar_noise
+        )
+
+def test_constant_noise_batch(signal_list):
+    noise_model = ConstantNoise()
+    noise_model._noise_distribution = lambda: 2
+    # A constant distribution is drawn once and broadcast over the batch
+    noise = noise_model.get_noise_batch(None, np.asarray(signal_list))
+    assert np.all(noise == 2)
+
+@pytest.mark.parametrize("noise_level",(1,2,3))
+def test_proportional_noise_batch(signal_list, noise_level):
+    noise_model = ProportionalNoise(noise_size=1)
+    noise_model._noise_distribution = lambda: noise_level
+    signals = np.asarray(signal_list)
+    noise = noise_model.get_noise_batch(None, signals)
+    assert np.allclose(noise/signals, noise_level)
 
 def test_proportional_noise_default(long_signal_list):
     noise_model = ProportionalNoise()
-    noise_list = [noise_model.get_noise(None, signal) for signal in long_signal_list]
-    rel_noise_list = [noise/signal
-                       for (signal, noise) in zip(long_signal_list, noise_list)]
-    evaluate_random_dist(rel_noise_list, size=0.1)
+    signals = np.asarray(long_signal_list)
+    noise = noise_model.get_noise_batch(None, signals)
+    evaluate_random_dist(noise/signals, size=0.1)
 
 def test_proportional_noise_given_size(long_signal_list):
     noise_model = ProportionalNoise(noise_size = 0.1)
-    noise_list = [noise_model.get_noise(None, signal) for signal in long_signal_list]
-    rel_noise_list = [noise/signal 
-                      for (signal,noise) in zip(long_signal_list, noise_list)]      
-    evaluate_random_dist(rel_noise_list, size=0.1)
+    signals = np.asarray(long_signal_list)
+    noise = noise_model.get_noise_batch(None, signals)
+    evaluate_random_dist(noise/signals, size=0.1)
 
 def test_random_noise(long_signal_list):
     noise_model = ConstantNoise()
-    noise_list = [noise_model.get_noise(None, signal) for signal in long_signal_list]
-    evaluate_random_dist(noise_list)
+    noise = noise_model.get_noise_batch(None, np.asarray(long_signal_list))
+    evaluate_random_dist(noise)
 
 @pytest.mark.parametrize("size", (1, 2, 47))
 def test_noise_size_constant(size, long_signal_list):
     noise_model = ConstantNoise(noise_size=size)
-    noise_list = [noise_model.get_noise(None, signal) for signal in long_signal_list]
-    evaluate_random_dist(noise_list,size)
+    noise = noise_model.get_noise_batch(None, np.asarray(long_signal_list))
+    evaluate_random_dist(noise, size)
 
 @pytest.mark.parametrize("size", (1, 2, 47))
 def test_noise_size_proportional(size, long_signal_list):
     noise_model = ProportionalNoise(noise_size=size)
-    noise_list = [noise_model.get_noise(None, signal) for signal in long_signal_list]
-    rel_noise_list = [noise/signal
-                       for (signal, noise) in zip(long_signal_list, noise_list)]
-    evaluate_random_dist(rel_noise_list, size)
+    signals = np.asarray(long_signal_list)
+    noise = noise_model.get_noise_batch(None, signals)
+    evaluate_random_dist(noise/signals, size)
 
 @pytest.mark.parametrize("input", (1, 2, 3))
 def test_data_dependent_noise(signal_list, input):
@@ -94,13 +123,13 @@ def test_data_dependent_noise(signal_list, input):
         local_noise_model._noise_distribution = lambda: X
         return local_noise_model
     noise_model = DataDependentNoise(noise_function=noise_choice)
-    noise_list = [noise_model.get_noise(input, signal) for signal in signal_list]  
-    assert [noise==signal for (signal, noise) in zip(signal_list, noise_list)]
+    noise = noise_model.get_noise_batch([input]*len(signal_list), signal_list)
+    assert np.all(noise == input)
 
 def test_zero_noise(signal_list):
     noise_model = ZeroNoise()
-    noise_list = [noise_model.get_noise(None, signal) for signal in signal_list]    
-    assert [noise==0 for noise in noise_list]
+    noise = noise_model.get_noise_batch(None, np.asarray(signal_list))
+    assert np.all(noise == 0)
 
 # Testing that the examples in the docstring of DataDependentNoise work
 @pytest.mark.parametrize("magnitude",(1,2,3))
@@ -109,23 +138,23 @@ def test_noise_model_example_1(long_signal_list, magnitude):
     noise_choice = lambda X: ConstantNoise(noise_size=X, seed=None)
     noise_model = DataDependentNoise(noise_function=noise_choice)
     data = [magnitude]*len(long_signal_list)
-    noise_list = [noise_model.get_noise(x, signal) 
-                  for (x, signal) in zip(data,long_signal_list)]
-    evaluate_random_dist(noise_list, magnitude)
+    noise = noise_model.get_noise_batch(data, np.asarray(long_signal_list))
+    evaluate_random_dist(noise, magnitude)
 
 def test_noise_model_example_2(long_signal_list):
     # the following two lines are taken from the docstring of DataDependentNoise
     noise_choice = lambda X: ZeroNoise() if X[0]==0 else ConstantNoise(seed=None)
     noise_model = DataDependentNoise(noise_function=noise_choice)
+    signals = np.asarray(long_signal_list)
     X = [0, 10, 5]
-    noise_list = [noise_model.get_noise(X, signal) for signal in long_signal_list]
-    (mean, stddev) = norm.fit(noise_list)
+    noise = noise_model.get_noise_batch([X]*len(signals), signals)
+    (mean, stddev) = norm.fit(noise)
     # This yields the zero noise model, where the fitted parameters are exactly zero
     assert mean==0
     assert stddev==0
     X = [1, 27, 53.4]
-    noise_list = [noise_model.get_noise(X, signal) for signal in long_signal_list]
-    evaluate_random_dist(noise_list)
+    noise = noise_model.get_noise_batch([X]*len(signals), signals)
+    evaluate_random_dist(noise)
 
 def test_sum_noise(signal_list):
     noise_model = SumNoise(noise_model_list=[
@@ -134,9 +163,9 @@ def test_sum_noise(signal_list):
     ])
     noise_model.noise_model_list[0]._noise_distribution = lambda: 2
     noise_model.noise_model_list[1]._noise_distribution = lambda: 3
-    noise_list = [noise_model.get_noise(None, signal) for signal in signal_list]
-    true_noise_list = [2 + 3 * signal for signal in signal_list]
-    assert noise_list == true_noise_list
+    signals = np.asarray(signal_list)
+    noise = noise_model.get_noise_batch(None, signals)
+    assert np.allclose(noise, 2 + 3*signals)
 
 # _sample_noise of SumNoise should not be accesible, since it is a composite NoiseModel,
 # and should ot have "its own" noise; it does not need it to retrun the sum of its
@@ -189,7 +218,7 @@ def test_parse_dict():
 def test_uniform_noise(long_signal_list):
     noise_model = ConstantNoise()
     noise_model.set_noise_type("uniform")
-    noise_list = [noise_model.get_noise(None, Y) for Y in long_signal_list]
+    noise_list = noise_model.get_noise_batch(None, np.asarray(long_signal_list))
     (start,width) = uniform.fit(noise_list)
     assert np.allclose(start, -1, atol=0.1)
     assert np.allclose(width, 2, atol=0.1)
@@ -746,3 +746,25 @@ def test_lhs():
     # Asserting the the values are the same for both the lhs, even though the order is different
     for i in range(4):
         assert set([x[i] for x in lhs_one]) == set([x[i] for x in lhs_two])    
+
+
+@pytest.mark.fast_test
+def test_sobol():
+    SPACE = Space(
+        [
+            Integer(1, 6),
+            Real(1, 7),
+            Real(10**-3, 10**3, prior="log-uniform"),
+        ]
+    )
+    samples = SPACE.sobol(16)
+    assert len(samples) == 16
+    assert len(samples[0]) == 3
+    # All samples should lie within the space
+    assert all(sample in SPACE for sample in samples)
+    # The default seed makes the samples reproducible
+    assert samples == SPACE.sobol(16)
+    # Different seeds scramble the sequence differently
+    assert samples != SPACE.sobol(16, seed=1)
+    # Non-powers of 2 are allowed, even if the sequence is then not balanced
+    assert len(SPACE.sobol(10)) == 10
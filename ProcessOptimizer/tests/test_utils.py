@@ -120,6 +120,35 @@ def test_expected_minimum_max():
     assert f_max == f_max2
 
 
+@pytest.mark.fast_test
+def test_expected_minimum_best_starts():
+    res = gp_minimize(bench3,
+                      [(-2.0, 2.0)],
+                      x0=[0.],
+                      noise=1e-8,
+                      n_calls=8,
+                      n_random_starts=3,
+                      random_state=1)
+
+    x_min, f_min = expected_minimum(res, random_state=1)
+    # Warm-starting from the best observations should find a minimum at
+    # least as good as the default with far fewer random starts
+    x_min2, f_min2 = expected_minimum(res,
+                                      random_state=1,
+                                      n_random_starts=5,
+                                      n_best_starts=5)
+    assert f_min2 <= f_min + 1e-8
+    # In max mode the best observations are the highest ones, so the
+    # warm-started maximum should be at least as good as the default
+    x_max, f_max = expected_minimum(res, random_state=1, minmax='max')
+    x_max2, f_max2 = expected_minimum(res,
+                                      random_state=1,
+                                      minmax='max',
+                                      n_random_starts=5,
+                                      n_best_starts=5)
+    assert f_max2 >= f_max - 1e-8
+
+
 @pytest.mark.fast_test
 def test_expected_minimum_minmax_argument():
     opt = Optimizer(dimensions=[(-2,2),('A','B')],
@@ -222,11 +222,12 @@ def check_x_in_space(x, space):
 
 
 def expected_minimum(
-    res, 
+    res,
     n_random_starts=20,
     random_state=None,
     return_std=False,
     minmax="min",
+    n_best_starts=0,
 ):
     """
     Compute the minimum over the predictions of the last surrogate model.
@@ -254,6 +255,12 @@ def expected_minimum(
         Whether the function should return the expected minimun (intended use)
         or the expected maximum (edge use case).
 
+    * `n_best_starts` [int, default=0]:
+        The number of best observed points to use as additional starting
+        points for the minimization. Warm-starting from the best
+        observations typically reaches the same solution quality with fewer
+        random starts.
+
     Returns
     -------
     * `x` [list]: location of the minimum (or maximum).
@@ -275,6 +282,13 @@ def expected_minimum(
             )
 
     xs = [res.x]
+    if n_best_starts > 0:
+        # "Best" depends on which extremum is sought: the lowest observed
+        # values when minimizing, the highest when maximizing
+        observation_order = np.argsort(res.func_vals)
+        if minmax == "max":
+            observation_order = observation_order[::-1]
+        xs.extend(res.x_iters[i] for i in observation_order[:n_best_starts])
     if n_random_starts > 0:
         xs.extend(res.space.rvs(n_random_starts, random_state=random_state))
     xs = res.space.transform(xs)